@@ -8,6 +8,7 @@
 import argparse
 import os
 from tomi.story import StoryType, generate_story
+from tomi.tokenizer import Tokenizer, ragged
 from tomi.world import World
 from tqdm import tqdm
 import numpy as np
@@ -18,10 +19,15 @@ def main(opt):
     N = opt.num_stories
     w = None  # world
     world = World()
+    tokenizer = Tokenizer(world) if opt.token_ids else None
+    if tokenizer is not None:
+        with open(os.path.join(opt.out_dir, "vocab.txt"), "w") as f:
+            print("\n".join(tokenizer.itos), file=f)
     for data_type in ["train", "val", "test"]:
         quota = {story_type: N // len(StoryType) for story_type in StoryType}
         stories_path = os.path.join(opt.out_dir, f"{data_type}.txt")
         trace_path = os.path.join(opt.out_dir, f"{data_type}.trace")
+        lines, story_lens, answers = [], [], []
         with open(stories_path, "w") as f, open(trace_path, "w") as trace_f, tqdm(
             total=N
         ) as pbar:
@@ -34,6 +40,10 @@ def main(opt):
                     # We've already generated enough of this type of story
                     continue
                 for story, trace in zip(stories, traces):
+                    if tokenizer is not None:
+                        lines.extend(tokenizer.encode_story(story))
+                        story_lens.append(len(story))
+                        answers.append(tokenizer.encode_answer(story[-1]))
                     print(
                         "\n".join(
                             [f"{i+1} {line.render()}" for i, line in enumerate(story)]
@@ -43,6 +53,15 @@ def main(opt):
                     print(",".join(trace + [story_type.value]), file=trace_f)
                     f.flush()
                 pbar.update(1)
+        if tokenizer is not None:
+            values, line_offsets = ragged(lines)
+            np.savez(
+                os.path.join(opt.out_dir, f"{data_type}.npz"),
+                values=values,
+                line_offsets=line_offsets,
+                story_offsets=np.cumsum([0] + story_lens),
+                answers=np.array(answers, dtype=np.int64),
+            )
 
 
 if __name__ == "__main__":
@@ -56,6 +75,11 @@ if __name__ == "__main__":
         help="Number of stories to generate for each type",
     )
     parser.add_argument("--out-dir", "-o", default="data", help="Output directory")
+    parser.add_argument(
+        "--token-ids",
+        action="store_true",
+        help="Also write token ids for each split and the vocabulary",
+    )
     opt = parser.parse_args()
     np.random.seed(opt.seed)
     random.seed(opt.seed)
@@ -12,8 +12,23 @@ from typing import List, Tuple
 
 
 class Action(object):
-    def __init__(self, templates):
-        self.templates = templates
+    # Every format string a subclass can render.  The tokenizer derives its
+    # vocabulary from these, so keep them in sync with the constructors.
+    formats = []
+
+    def __init__(self, templates, fill=None):
+        # Patterns are only formatted with their fill when rendered, so the
+        # tokenizer can encode an action without building its string.  A fill
+        # of None means the templates are literal text.
+        self.patterns = templates
+        self.fill = fill
+
+    def choose(self):
+        # Index of the template to render.  It is drawn once so that the text
+        # and the token ids of an action always agree.
+        if not hasattr(self, "fixed"):
+            self.fixed = np.random.randint(0, len(self.patterns))
+        return self.fixed
 
     def render(self):
         raise NotImplementedError
@@ -21,85 +36,88 @@ class Action(object):
 
 class DeclarativeAction(Action):
     def render(self):
-        if hasattr(self, "fixed"):
-            return self.templates[self.fixed]
-        return np.random.choice(self.templates)
+        pattern = self.patterns[self.choose()]
+        return pattern if self.fill is None else pattern % self.fill
 
 
 class InterrogativeAction(Action):
     def render(self):
-        if hasattr(self, "fixed"):
-            return self.templates[self.fixed]
-        return np.random.choice(self.templates)
+        pattern = self.patterns[self.choose()]
+        return pattern if self.fill is None else pattern % self.fill
 
 
 class ExitAction(DeclarativeAction):
-    def __init__(self):
-        super.__init__(
-            ["%s exited the %s.", "%s left the %s.", "%s went out of the %s.",]
-        )
+    formats = ["%s exited the %s.", "%s left the %s.", "%s went out of the %s."]
+
+    def __init__(self, oracle: Oracle, agent: str):
+        fill = (agent, oracle.get_location(agent))
+
+        super().__init__(self.formats, fill)
+        oracle.set_location(agent, None)
 
 
 class SearchedAction(InterrogativeAction):
+    formats = ["Where will %s look for the %s?\t%s\t1"]
+
     def __init__(self, oracle: Oracle, agent: str, obj: str):
         ans = oracle.get_direct_belief(agent, obj)
         # Label whether or not this question requires theory of mind
         self.tom = ans != oracle.get_object_container(obj)
         fill = (agent, obj, ans)
-        super().__init__(
-            ["Where will %s look for the %s?\t%s\t1" % fill,]
-        )
+        super().__init__(self.formats, fill)
 
 
 class BeliefSearchAction(InterrogativeAction):
+    formats = ["Where does %s think that %s searches for the %s?\t%s\t1"]
+
     def __init__(self, oracle: Oracle, a1: str, a2: str, obj: str):
         ans = oracle.get_indirect_belief(a1, a2, obj)
         # Does this question require theory of mind?
         self.tom = ans != oracle.get_object_container(obj)
         fill = (a1, a2, obj, ans)
-        super().__init__(
-            ["Where does %s think that %s searches for the %s?\t%s\t1" % fill,]
-        )
+        super().__init__(self.formats, fill)
 
 
 class RealityAction(InterrogativeAction):
+    formats = ["Where is the %s really?\t%s\t1"]
+
     def __init__(self, oracle: Oracle, obj: str):
         fill = (obj, oracle.get_object_container(obj))
-        super().__init__(
-            ["Where is the %s really?\t%s\t1" % fill,]
-        )
+        super().__init__(self.formats, fill)
 
 
 class MemoryAction(InterrogativeAction):
+    formats = ["Where was the %s at the beginning?\t%s\t1"]
+
     def __init__(self, oracle_start_state: Oracle, obj: str):
         fill = (obj, oracle_start_state.locations.obj_containers[obj])
-        super().__init__(
-            ["Where was the %s at the beginning?\t%s\t1" % fill,]
-        )
+        super().__init__(self.formats, fill)
 
 
 class LocationAction(DeclarativeAction):
+    formats = ["%s is in the %s.", "%s and %s are in the %s."]
+
     def __init__(self, oracle: Oracle, args: str):
         if len(args) == 2:
-            statement = "%s is in the %s." % args
+            pattern = self.formats[0]
             a1, loc = args
             # may be redundant
             oracle.set_location(a1, loc)
         else:  # 2 people
-            statement = "%s and %s are in the %s." % args
+            pattern = self.formats[1]
             a1, a2, loc = args
             # may be redundant
             oracle.set_location(a1, loc)
             oracle.set_location(a2, loc)
-        super().__init__([statement])
+        super().__init__([pattern], args)
 
 
 class ObjectLocAction(DeclarativeAction):
+    formats = ["The %s is in the %s."]
+
     def __init__(self, oracle: Oracle, obj: str, observers: List[str]):
         container = oracle.get_object_container(obj)
-        super().__init__(
-            ["The %s is in the %s." % (obj, container),]
-        )
+        super().__init__(self.formats, (obj, container))
 
         # set direct beliefs
         for observer in observers:
@@ -113,22 +131,22 @@ class ObjectLocAction(DeclarativeAction):
 
 
 class ExitedAction(DeclarativeAction):
+    formats = ["%s exited the %s."]
+
     def __init__(self, oracle: Oracle, agent: str):
         fill = (agent, oracle.get_location(agent))
 
-        super().__init__(
-            ["%s exited the %s." % fill,]
-        )
+        super().__init__(self.formats, fill)
         oracle.set_location(agent, None)
 
 
 class MoveAction(DeclarativeAction):
+    formats = ["%s moved the %s to the %s."]
+
     def __init__(
         self, oracle: Oracle, args: Tuple[str, str, str], observers: List[str] = None
     ):
-        super().__init__(
-            ["%s moved the %s to the %s." % args,]
-        )
+        super().__init__(self.formats, args)
 
         agent, obj, container = args
         oracle.set_object_container(obj, container)
@@ -148,10 +166,10 @@ class MoveAction(DeclarativeAction):
 
 
 class PeekAction(DeclarativeAction):
+    formats = ["%s looked in the %s."]
+
     def __init__(self, oracle, args: Tuple[str, str], observers: List[str] = None):
-        super().__init__(
-            ["%s looked in the %s." % args,]
-        )
+        super().__init__(self.formats, args)
 
         agent, container = args
         contents = oracle.get_container_obj(container)
@@ -174,10 +192,10 @@ class PeekAction(DeclarativeAction):
 
 
 class TellAction(DeclarativeAction):
+    formats = ["%s told %s where the %s is."]
+
     def __init__(self, oracle: Oracle, a1: str, a2: str, obj: str):
-        super().__init__(
-            ["%s told %s where the %s is." % (a1, a2, obj),]
-        )
+        super().__init__(self.formats, (a1, a2, obj))
 
         container = oracle.get_object_container(obj)
         oracle.set_direct_belief(a2, obj, container)
@@ -185,6 +203,8 @@ class TellAction(DeclarativeAction):
 
 
 class EnterAction(DeclarativeAction):
+    formats = ["%s entered the %s."]
+
     def __init__(
         self,
         oracle: Oracle,
@@ -192,9 +212,7 @@ class EnterAction(DeclarativeAction):
         observers: List[str] = None,
         no_world_adjust: bool = False,
     ):
-        super().__init__(
-            ["%s entered the %s." % args,]
-        )
+        super().__init__(self.formats, args)
 
         agent, location = args
         oracle.set_location(agent, location)
@@ -218,13 +236,13 @@ class EnterAction(DeclarativeAction):
 
 
 class NoiseAction(DeclarativeAction):
+    formats = [
+        "%s likes the %s",
+        "%s dislikes the %s",
+        "%s loves the %s",
+        "%s hates the %s",
+    ]
+
     def __init__(self, oracle: Oracle, person: str, thing: str):
-        super().__init__(
-            [
-                f"{person} likes the {thing}",
-                f"{person} dislikes the {thing}",
-                f"{person} loves the {thing}",
-                f"{person} hates the {thing}",
-            ]
-        )
-        self.fixed = np.random.randint(0, len(self.templates))
+        super().__init__(self.formats, (person, thing))
+        self.fixed = np.random.randint(0, len(self.patterns))
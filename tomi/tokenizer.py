@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Copyright (c) 2019-present, Facebook, Inc.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+
+
+import re
+import numpy as np
+from itertools import chain
+from . import actions
+from .world import World
+from typing import Dict, List, Optional, Tuple
+
+# Entity names are single tokens, including hyphenated ones such as t-shirt.
+# Other punctuation is split off.
+TOKEN_RE = re.compile(r"%s|[\w-]+|[^\w\s]")
+SLOT = "%s"
+PAD = "<pad>"
+UNK = "<unk>"
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text)
+
+
+def _action_classes(cls=actions.Action):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from _action_classes(sub)
+
+
+class Tokenizer(object):
+    """
+    Closed vocabulary over the world entities and the action templates.
+
+    Actions are encoded straight from their patterns and fill, without
+    formatting or re-parsing the text.  Ids 0 and 1 are reserved for padding and unknown
+    tokens.  Questions are encoded without their answer, which is available
+    separately through `encode_answer`.
+    """
+
+    def __init__(self, world: Optional[World] = None):
+        if world is None:
+            world = World()
+        words = set()
+        for cls in _action_classes():
+            for pattern in cls.formats:
+                words.update(t for t in tokenize(pattern) if t != SLOT)
+        for entities in world.entities.values():
+            words.update(entities)
+        self.itos = [PAD, UNK] + sorted(words)
+        self.stoi = {t: i for i, t in enumerate(self.itos)}
+        self.pad_id = self.stoi[PAD]
+        self.unk_id = self.stoi[UNK]
+        # pattern -> (token ids with the fill slots unset, slot positions)
+        self._compiled: Dict[str, Tuple[List[int], Tuple[int, ...]]] = {}
+
+    def __len__(self):
+        return len(self.itos)
+
+    def token_id(self, token: str) -> int:
+        return self.stoi.get(token, self.unk_id)
+
+    def _compile(self, pattern: str) -> Tuple[List[int], Tuple[int, ...]]:
+        if pattern not in self._compiled:
+            # Questions carry "\t<answer>\t<supporting fact>" after the text
+            tokens = tokenize(pattern.split("\t")[0])
+            ids = [self.pad_id if t == SLOT else self.token_id(t) for t in tokens]
+            slots = tuple(i for i, t in enumerate(tokens) if t == SLOT)
+            self._compiled[pattern] = (ids, slots)
+        return self._compiled[pattern]
+
+    def encode(self, action: actions.Action) -> List[int]:
+        if action.fill is None:
+            raise ValueError(f"{type(action).__name__} has no patterns to encode")
+        ids, slots = self._compile(action.patterns[action.choose()])
+        ids = list(ids)
+        for pos, fill in zip(slots, action.fill):
+            ids[pos] = self.stoi.get(fill, self.unk_id)
+        return ids
+
+    def encode_answer(self, action: actions.InterrogativeAction) -> int:
+        if action.fill is None:
+            raise ValueError(f"{type(action).__name__} has no answer to encode")
+        _, slots = self._compile(action.patterns[0])
+        return self.token_id(action.fill[len(slots)])
+
+    def encode_story(self, story: List[actions.Action]) -> List[List[int]]:
+        return [self.encode(action) for action in story]
+
+    def decode(self, ids) -> str:
+        return " ".join(self.itos[i] for i in ids if i != self.pad_id)
+
+
+def pad(sequences: List[List[int]], pad_id: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns a (batch, max_len) array and the length of each row
+    lengths = np.array([len(s) for s in sequences], dtype=np.int64)
+    batch = np.full((len(sequences), lengths.max(initial=0)), pad_id, dtype=np.int64)
+    for row, seq in zip(batch, sequences):
+        row[: len(seq)] = seq
+    return batch, lengths
+
+
+def ragged(sequences: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns the concatenated values and offsets, row i is
+    # values[offsets[i]:offsets[i + 1]]
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum([len(s) for s in sequences], out=offsets[1:])
+    values = np.fromiter(chain.from_iterable(sequences), np.int64, offsets[-1])
+    return values, offsets